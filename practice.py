@@ -1,12 +1,37 @@
+import os
+from typing import Callable, Iterable, NamedTuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the jitted core below simply runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(function):
+            return function
+        return decorator
+
 from practice_support import *
 
+# Kind tags carried as class attributes so code can dispatch on a cheap int
+# comparison instead of an isinstance check
+KIND_OTHER = 0
+KIND_CRATE = 1
+KIND_POTION = 2
+KIND_GOAL = 3
+
+
 class Tile(object):
     """An abstract class from which all instantiable types of tiles inheret. Provides the default tile behaviour, which
     can be inhereted or overwritten by specific types of tiles. The __init__ methods for all tiles do not take any
     arguments beyond self.
     """
-    
+
+    __slots__ = ()
+
     _type = 'Abstract Tile'
+    _kind = KIND_OTHER
     
     def is_blocking(self) -> bool:
         """Returns True only when this tile is blocking. A tile is blocking if an entity would not be able to move onto that
@@ -21,9 +46,10 @@ class Tile(object):
     
     def __str__(self) -> str:
         """Returns a string representing the type of this tile. In most cases, this will be the same string as would be
-        returned by get_type."""
-        return self.get_type()
-    
+        returned by get_type; it reads _type directly so rendering a tile costs one attribute load rather than a
+        method call."""
+        return self._type
+
     def __repr__(self) -> str:
         """Operates identically to the __str__ method."""
         return str(self)  # return self.__str__()
@@ -32,19 +58,37 @@ class Tile(object):
 class Floor(Tile):
     """Floor is a basic type of tile that represents an empty space on which entities can freely move. It is non-blocking
     and is represented by a single space character."""
+    __slots__ = ()
+
     _type = FLOOR
-    
-    
+    _instance = None
+
+    def __new__(cls) -> 'Floor':
+        # floors carry no mutable state, so every Floor() is the same shared instance
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
 class Wall(Tile):
     """Wall is a type of tile that represents a wall through which entities cannot pass. Wall tiles are blocking, and are
     represented by the character ‘W’.
     """
-    _type = WALL    
-    
+    __slots__ = ()
+
+    _type = WALL
+    _instance = None
+
+    def __new__(cls) -> 'Wall':
+        # walls carry no mutable state, so every Wall() is the same shared instance
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def is_blocking(self) -> bool:
         """Walls are blocking."""
         return True
-    
+
 
 class Goal(Tile):
     """Goal is a type of tile that represents a goal location for a crate. Goal tiles are non-blocking, and the type
@@ -53,26 +97,44 @@ class Goal(Tile):
     onto them. If a goal tile is unfilled, the __str__ and __repr__ methods return ‘G’. However, when a goal tile
     becomes filled, the __str__ and __repr__ methods should instead return ‘X’ to denote that this goal tile is
     filled. """
+    __slots__ = ('_fill',)
+
     _type = GOAL
-    
+    _kind = KIND_GOAL
+
     def __init__(self) -> None:
         super().__init__()
         self._fill = False
-    
+
     def is_filled(self) -> bool:
         """Returns True only when the goal is filled."""
         return self._fill
-        
+
     def fill(self):
         """Sets this goal to be filled."""
         self._fill = True
-        self._type = FILLED_GOAL
-    
+
+    def get_type(self) -> str:
+        """Returns ‘X’ once the goal is filled, and ‘G’ otherwise."""
+        return FILLED_GOAL if self._fill else GOAL
+
+    def __str__(self) -> str:
+        """Returns ‘X’ once the goal is filled, and ‘G’ otherwise."""
+        return FILLED_GOAL if self._fill else GOAL
+
+
+# shared flyweight tiles used when materializing the maze for the view
+_FLOOR = Floor()
+_WALL = Wall()
+
 
 class Entity(object):
     """Abstract base class from which all entities inherit. The __init__ methods for this class does not take any
     arguments beyond self."""
+    __slots__ = ()
+
     _type = 'Abstract Entity'
+    _kind = KIND_OTHER
     
     def get_type(self) -> str:
         """Returns a string representing the type of this entity. For the abstract Entity class, this method returns
@@ -86,8 +148,9 @@ class Entity(object):
     
     def __str__(self) -> str:
         """Returns a string representing the type of this entity. In most cases, this will be the same string as would be
-        returned by get_type."""
-        return self.get_type()
+        returned by get_type; it reads _type directly so rendering an entity costs one attribute load rather than a
+        method call."""
+        return self._type
     
     def __repr__(self) -> str:
         """Operates identically to the __str__ method."""
@@ -98,22 +161,27 @@ class Crate(Entity):
     """Crate is a movable entity, represented (in get_type) by the letter ‘C’. Crates are constructed with a strength
     value, which represents the strength a player is required to have in order to move that crate. The string 
     representation of a crate should be the string version of its strength value."""
+    __slots__ = ('_strength', '_str')
+
     _type = CRATE
-    
+    _kind = KIND_CRATE
+
     def __init__(self, strength: int) -> None:
         """Ensure any code from the Entity constructor is run, and set this crate’s strength value to strength."""
         super().__init__()
         self._strength = strength
-        
+        # the view renders every crate each turn, so cache the string once
+        self._str = str(strength)
+
     def get_strength(self) -> int:
         """Returns this crate’s strength value."""
         return self._strength
 
     def __str__(self) -> str:
-        return str(self.get_strength())
-    
+        return self._str
+
     def __repr__(self) -> str:
-        return str(self)
+        return self._str
     
 
 class Potion(Entity):
@@ -121,40 +189,43 @@ class Potion(Entity):
     __init__ method for all potions do not take any arguments besides self. Since this class inherits from Entity,
     it (along with its subclasses) should also provide all methods available from the Entity class. Potions are not
     movable. An abstract potion is represented by ‘Potion’ and has no effect."""
+    __slots__ = ()
+
     _type = 'Potion'
-    
+    _kind = KIND_POTION
+    _EFFECT: dict[str, int] = dict()
+
     def effect(self) -> dict[str, int]:
         """Returns a dictionary describing the effect this potion would have on a player. Note that potions are not
         responsible for applying their effects to a player; they only need to provide information about the effects they
-        would cause. The abstract potion class should just return an empty dictionary, since it has no effect."""
-        return dict()
-    
+        would cause. The effect of a potion never changes, so each class shares one precomputed dictionary rather
+        than building a fresh one per call. The abstract potion class has no effect, so its dictionary is empty."""
+        return self._EFFECT
+
 
 class StrengthPotion(Potion):
     """A StrengthPotion is represented by the string ‘S’ and provides the player with an additional 2 strength."""
+    __slots__ = ()
+
     _type = STRENGTH_POTION
-    
-    def effect(self) -> dict[str, int]:
-        """The strength potion class should return a dictionary with strength: 2"""
-        return {'strength': 2}
-    
+    _EFFECT = {'strength': 2}
+
+
 class MovePotion(Potion):
     """A MovePotion is represented by the string ‘M’ and provides the player with 5 more moves."""
+    __slots__ = ()
+
     _type = MOVE_POTION
-    
-    def effect(self) -> dict[str, int]:
-        """The move potion class should return a dictionary with moves: 5"""
-        return {'moves': 5}
+    _EFFECT = {'moves': 5}
+
 
-    
 class FancyPotion(Potion):
     """A FancyPotion is represented by the string ‘F’ and provides the player with an additional 2 strength and 2
     more moves."""
+    __slots__ = ()
+
     _type = FANCY_POTION
-    
-    def effect(self) -> dict[str, int]:
-        """The fancy potion class should return a dictionary with moves: 2 and strength: 2"""
-        return {'strength': 2,'moves': 2}
+    _EFFECT = {'strength': 2, 'moves': 2}
 
 
 class Player(Entity):
@@ -162,6 +233,8 @@ class Player(Entity):
     strength and an initial number of moves remaining. These two values can change throughout regular gameplay,
     or through the use of potions, via methods provided by the Player class. A player is only movable if they have
     a positive number of moves remaining."""
+    __slots__ = ('_start_strength', '_moves_remaining')
+
     _type = PLAYER
     
     def __init__(self, start_strength: int, moves_remaining: int) -> None:
@@ -196,44 +269,111 @@ class Player(Entity):
         self.add_moves_remaining(potion_effect.get("moves", 0))
     
 
-def convert_maze(game: list[list[str]]) -> tuple[Grid, Entities, Position]:
-    """This function converts the simple format of the maze representation into a more sophisticated representation."""
-    grid: Grid = list()
-    entities: Entities = dict()
+# Jump tables for convert_maze: one dict lookup per character instead of a
+# chain of string comparisons. Crates are handled by a digit fast path.
+_CHAR_TO_TILE_CODE = {
+    WALL: WALL_CODE,
+    GOAL: GOAL_CODE,
+    FILLED_GOAL: FILLED_GOAL_CODE,
+}
+
+_CHAR_TO_ENTITY = {
+    STRENGTH_POTION: StrengthPotion,
+    MOVE_POTION: MovePotion,
+    FANCY_POTION: FancyPotion,
+}
+
+
+def convert_maze(game: list[list[str]]) -> tuple[np.ndarray, dict[int, Entity], Position]:
+    """This function converts the simple format of the maze representation into a more sophisticated representation.
+
+    The tiles are packed into a 2D uint8 array keyed by the tile code constants, which is far more compact than a
+    list of lists of Tile instances and lets the model test cells with plain integer comparisons. Cells occupied by
+    an entity or the player are floor underneath, so they are left as FLOOR_CODE. Entities are keyed by the
+    flattened cell index (row * cols + col) so lookups hash a plain int rather than a freshly built tuple.
+    """
+    rows, cols = len(game), len(game[0])
+    grid = np.full((rows, cols), FLOOR_CODE, dtype=np.uint8)
+    entities: dict[int, Entity] = dict()
     player_position: Position = None
-    for i in range(len(game)):
+    for i in range(rows):
         row = game[i]
-        temp = list()
         for j in range(len(row)):
-            # (i, j) -> Tile | Entity | Player
-            position = i, j
             char: str = row[j]  # W, 1, G, P
-            if char == WALL:
-                temp.append(Wall())
-            elif char == GOAL:
-                temp.append(Goal())
-            elif char == FILLED_GOAL:
-                goal = Goal()
-                goal.fill()
-                temp.append(goal)
-            elif char == FLOOR:
-                temp.append(Floor())
-            elif char.isdigit():
-                strength = int(char)
-                crate = Crate(strength=strength)
-                entities[position] = crate
-            elif char == STRENGTH_POTION:
-                entities[position] = StrengthPotion()
-            elif char == MOVE_POTION:
-                entities[position] = MovePotion()
-            elif char == FANCY_POTION:
-                entities[position] = FancyPotion()
+            if '0' <= char <= '9':
+                entities[i * cols + j] = Crate(strength=int(char))
+                continue
+            tile_code = _CHAR_TO_TILE_CODE.get(char)
+            if tile_code is not None:
+                grid[i, j] = tile_code
+                continue
+            entity_factory = _CHAR_TO_ENTITY.get(char)
+            if entity_factory is not None:
+                entities[i * cols + j] = entity_factory()
             elif char == PLAYER:
-                player_position = position
-        grid.append(temp)
+                player_position = i, j
     return grid, entities, player_position
 
 
+_POTION_CODES = {
+    STRENGTH_POTION: STRENGTH_POTION_CODE,
+    MOVE_POTION: MOVE_POTION_CODE,
+    FANCY_POTION: FANCY_POTION_CODE,
+}
+
+_CODE_TO_POTION = {
+    STRENGTH_POTION_CODE: StrengthPotion,
+    MOVE_POTION_CODE: MovePotion,
+    FANCY_POTION_CODE: FancyPotion,
+}
+
+# Outcome codes returned by _attempt_move_core
+MOVE_BLOCKED = 0
+MOVE_PLAIN = 1
+MOVE_PUSH_CRATE = 2
+MOVE_FILL_GOAL = 3
+MOVE_PICKUP = 4
+
+
+@njit(nogil=True, cache=True)
+def _attempt_move_core(
+    grid: np.ndarray,
+    entity_grid: np.ndarray,
+    x1: int,
+    y1: int,
+    dx: int,
+    dy: int,
+    strength: int,
+) -> int:
+    """The geometric half of attempt_move: blocking and crate-push checks over the uint8 grids.
+
+    Everything here is integer arithmetic and array indexing, so numba compiles it to native code. The grids are
+    padded with a one-cell sentinel ring of walls and the coordinates are in the padded system, so there are no
+    bounds checks at all: stepping off the real maze lands on the ring and is rejected as a wall. The function
+    only decides what kind of move this is (one of the MOVE_* outcome codes); the caller applies the side effects,
+    since those involve the entities dictionary and the player stats."""
+    x2, y2 = x1 + dx, y1 + dy
+    if grid[x2, y2] == WALL_CODE:
+        return MOVE_BLOCKED
+    code = entity_grid[x2, y2]
+    if code == 0:
+        return MOVE_PLAIN
+    if code <= CRATE_CODE_MAX:
+        # a crate; its code is its strength plus one
+        if strength < code - 1:
+            return MOVE_BLOCKED
+        x3, y3 = x2 + dx, y2 + dy
+        target = grid[x3, y3]
+        if target == WALL_CODE:
+            return MOVE_BLOCKED
+        if entity_grid[x3, y3] != 0:
+            return MOVE_BLOCKED
+        if target == GOAL_CODE:
+            return MOVE_FILL_GOAL
+        return MOVE_PUSH_CRATE
+    return MOVE_PICKUP
+
+
 class SokobanModel(object):
     """"""
     def __init__(self, maze_file: str) -> None:
@@ -245,113 +385,297 @@ class SokobanModel(object):
             maze_file(str): filename of the maze to load
         """
         raw_maze, player_stats = read_file(maze_file)
-        self._grid, self._entities, self._player_position = convert_maze(raw_maze)
-        player_strength, moves = player_stats
-        self._player = Player(player_strength, moves)
-        self._rows = len(self._grid)        
-        self._cols = len(self._grid[0])
-        
+        interior, entities, player_position = convert_maze(raw_maze)
+        self._build(interior, entities, player_position, player_stats)
+
+    def _build(
+        self,
+        interior: np.ndarray,
+        entities: dict[int, Entity],
+        player_position: Position,
+        player_stats: list[int],
+    ) -> None:
+        """Shared constructor body: sets up the padded grids and internal state from a parsed maze. Called both
+        when parsing a maze file and when restoring from the binary cache."""
+        px, py = player_position
+        self._unfilled_goal_count = int(np.count_nonzero(interior == GOAL_CODE))
+        # the player's stats are just two ints, so the model stores them
+        # directly rather than going through a Player instance per access
+        self._player_strength, self._player_moves = player_stats
+        self._rows, self._cols = interior.shape
+        # both grids carry a one-cell sentinel ring of walls and all internal
+        # coordinates (player position, entity keys, dirty cells) live in the
+        # padded system, so the move core needs no bounds checks at all;
+        # the accessors translate back to real maze coordinates
+        self._stride = self._cols + 2
+        self._grid = np.full((self._rows + 2, self._stride), WALL_CODE, dtype=np.uint8)
+        self._grid[1:-1, 1:-1] = interior
+        self._player_position = (px + 1, py + 1)
+        # parallel uint8 grid of entity codes, kept in sync with the entities
+        # dict so the jitted move core never has to touch Python objects
+        self._entity_grid = np.zeros(self._grid.shape, dtype=np.uint8)
+        self._entities = dict()
+        for index, entity in entities.items():
+            i, j = divmod(index, self._cols)
+            if entity._kind == KIND_CRATE:
+                code = entity.get_strength() + 1
+            else:
+                code = _POTION_CODES[entity.get_type()]
+            self._entity_grid[i + 1, j + 1] = code
+            self._entities[(i + 1) * self._stride + (j + 1)] = entity
+        # positions whose display has changed since the last redraw
+        self._dirty: set[Position] = set()
+
+    @classmethod
+    def load_cached(cls, maze_file: str) -> 'SokobanModel':
+        """Constructs a model from a pre-parsed binary cache of the maze, creating the cache on first load.
+
+        The parsed grid, entity positions and codes, player position and player stats are saved next to the maze
+        file as maze_file + '.npz'. Later loads read those arrays straight back and skip the character-by-character
+        parse, which matters when solvers or agents instantiate thousands of models from the same maze. A cache
+        older than its maze file is ignored and rebuilt."""
+        cache_file = maze_file + '.npz'
+        try:
+            fresh = os.path.getmtime(cache_file) >= os.path.getmtime(maze_file)
+        except OSError:
+            fresh = False
+        if not fresh:
+            model = cls(maze_file)
+            model._save_cache(cache_file)
+            return model
+        data = np.load(cache_file)
+        entities: dict[int, Entity] = dict()
+        for index, code in zip(data['positions'], data['codes']):
+            code = int(code)
+            if code <= CRATE_CODE_MAX:
+                entities[int(index)] = Crate(code - 1)
+            else:
+                entities[int(index)] = _CODE_TO_POTION[code]()
+        model = cls.__new__(cls)
+        model._build(
+            data['grid'],
+            entities,
+            tuple(int(value) for value in data['player_position']),
+            [int(value) for value in data['player_stats']],
+        )
+        return model
+
+    def _save_cache(self, cache_file: str) -> None:
+        """Writes the freshly parsed state of this model to the given cache file. Only valid on a model that has
+        not been played yet, so the cache records the maze's starting state."""
+        stride = self._stride
+        cols = self._cols
+        keys = sorted(self._entities)
+        positions = np.array(
+            [(key // stride - 1) * cols + (key % stride - 1) for key in keys],
+            dtype=np.int32,
+        )
+        codes = np.array(
+            [self._entity_grid[divmod(key, stride)] for key in keys],
+            dtype=np.uint8,
+        )
+        np.savez(
+            cache_file,
+            grid=self._grid[1:-1, 1:-1],
+            positions=positions,
+            codes=codes,
+            player_position=np.array(self.get_player_position(), dtype=np.int32),
+            player_stats=np.array(
+                [self._player_strength, self._player_moves], dtype=np.int32
+            ),
+        )
 
     def get_maze(self) -> Grid:
-        """Returns the maze representation (list of lists of Tile instances)."""
-        return self._grid
+        """Returns the maze representation (list of lists of Tile instances).
+
+        The tiles are materialized on demand from the interior of the internal uint8 grid (the sentinel wall ring
+        is not part of the maze), so the view keeps working with Tile instances while the model itself only stores
+        integer codes."""
+        maze: Grid = list()
+        for row in self._grid[1:-1, 1:-1]:
+            temp = list()
+            for code in row:
+                if code == WALL_CODE:
+                    temp.append(_WALL)
+                elif code == GOAL_CODE:
+                    temp.append(Goal())
+                elif code == FILLED_GOAL_CODE:
+                    goal = Goal()
+                    goal.fill()
+                    temp.append(goal)
+                else:
+                    temp.append(_FLOOR)
+            maze.append(temp)
+        return maze
     
     def get_entities(self) -> Entities:
-        """Returns the dicitonary mapping positions to non-player entities."""
-        return self._entities
+        """Returns the dicitonary mapping positions to non-player entities.
+
+        Internally entities are keyed by flattened padded cell index; the keys are decoded back to real-maze
+        (row, col) tuples here so callers (such as the view) see the usual position-keyed dictionary."""
+        stride = self._stride
+        return {
+            (index // stride - 1, index % stride - 1): entity
+            for index, entity in self._entities.items()
+        }
     
     def get_player_position(self) -> Position:
         """Returns the player’s current position."""
-        return self._player_position
+        x, y = self._player_position
+        return x - 1, y - 1
+
+    def get_dirty_positions(self) -> set[Position]:
+        """Returns the positions whose display has changed since the dirty set was last cleared."""
+        return {(x - 1, y - 1) for x, y in self._dirty}
+
+    def clear_dirty(self) -> None:
+        """Empties the dirty position set. Called once the changed cells have been redrawn."""
+        self._dirty.clear()
     
     def get_player_moves_remaining(self) -> int:
         """Returns the number of moves the player has remaining."""
-        return self._player.get_moves_remaining()
-    
+        return self._player_moves
+
     def get_player_strength(self) -> int:
         """Returns the player’s current strength."""
-        return self._player.get_strength()
+        return self._player_strength
     
     def attempt_move(self, direction: str) -> bool:
         """"""
-        # check if direction is valid
-        if direction not in DIRECTION_DELTAS:
+        # dispatch to the method specialized for this direction; the delta
+        # constants are already inlined into its body
+        move = self._DISPATCH.get(direction)
+        if move is None:
             return False
-        dx, dy = DIRECTION_DELTAS[direction]
-        x1, y1 = self.get_player_position()
-        x2, y2 = x1 + dx, y1 + dy
-        # check if new position would be out of bounds
-        if x2 < 0 or x2 >= self._rows:
-            return False
-        if y2 < 0 or y2 >= self._cols:
-            return False
-        # check if blocked by a blocking tile
-        tile: Tile = self._grid[x2][y2]
-        if tile.is_blocking():
-            return False
-        # see if it's a crate
-        entity = self._entities.get((x2, y2))
-        if isinstance(entity, Crate):
-            # not enough strength
-            if self.get_player_strength() < entity.get_strength():
-                return False
-            x3, y3 = x2 + dx, y2 + dy
-
-            # check if new position would be out of bounds
-            if x3 < 0 or x3 >= self._rows:
-                return False
-            if y3 < 0 or y3 >= self._cols:
-                return False
-            # check if blocked by a blocking tile
-            tile: Tile = self._grid[x3][y3]
-            if tile.is_blocking():
-                return False
-            if self._entities.get((x3, y3)):
-                return False
-            if isinstance(tile, Goal):
-                if not tile.is_filled():
-                    # remove the crate
-                    self._entities.pop((x2, y2))
-                    # set goal to be filled
-                    tile.fill()
-                    # move player to crate's position
-                    self._player_position = (x2, y2)
-                    # update moves
-                    self._player.add_moves_remaining(-1)
-                    return True
-            # move the crate to new position (x3, y3)
-            self._entities[(x3, y3)] = entity
-            self._entities.pop((x2, y2))
-            self._player_position = (x2, y2)
-            self._player.add_moves_remaining(-1)
-            return True
-            
-        elif isinstance(entity, Potion):
-            self._entities.pop((x2, y2))
-            self._player.apply_effect(entity.effect())
-            # move player to crate's position
-            self._player_position = (x2, y2)
-            # update moves
-            self._player.add_moves_remaining(-1)
-            return True
-        else:
-            # move player to crate's position
-            self._player_position = (x2, y2)
-            # update moves
-            self._player.add_moves_remaining(-1)
-            return True
+        return move(self)
     
     def has_won(self) -> bool:
         """Returns True only when the game has been won. The game has been won if all goals are filled, or equivalently
-        (since the number of goals is always equal to the number of crates), there are no more crates on the grid."""
-        for row in self._grid:
-            for tile in row:
-                if isinstance(tile, Goal):
-                    if not tile.is_filled():
-                        return False
-        return True
-    
-    
+        (since the number of goals is always equal to the number of crates), there are no more crates on the grid.
+        The count of unfilled goals is maintained incrementally by attempt_move, so this is a constant-time check."""
+        return self._unfilled_goal_count == 0
+
+    def encode_state(self) -> int:
+        """Packs the full game state into a single int, for use as a visited-set key by search-based solvers.
+
+        The layout, from the low bits up, is: the player's flattened cell index, a bitmap of cells holding an
+        entity, a bitmap of cells holding an unfilled goal, and then one 4-bit entity code per occupied cell in
+        increasing cell order. Hashing the resulting int is far cheaper than hashing a (position, frozenset of
+        crates) tuple and allocates nothing. Small mazes fit comfortably in a machine word or two. The player's
+        strength and remaining moves are not included; callers tracking potions should key on those separately."""
+        cols = self._cols
+        stride = self._stride
+        cells = self._rows * cols
+        x, y = self._player_position
+        entity_grid = self._entity_grid
+        entity_map = 0
+        codes = 0
+        for slot, key in enumerate(sorted(self._entities)):
+            i, j = divmod(key, stride)
+            entity_map |= 1 << ((i - 1) * cols + (j - 1))
+            codes |= int(entity_grid[i, j]) << (4 * slot)
+        goal_map = 0
+        for index in np.flatnonzero(self._grid[1:-1, 1:-1] == GOAL_CODE):
+            goal_map |= 1 << int(index)
+        index_bits = cells.bit_length()
+        state = (codes << cells) | goal_map
+        state = (state << cells) | entity_map
+        return (state << index_bits) | ((x - 1) * cols + (y - 1))
+
+    def decode_state(self, state: int) -> tuple[Position, dict[Position, int], list[Position]]:
+        """Reverses encode_state, for debugging. Returns the player position, a dictionary mapping each occupied
+        position to its entity code, and the list of unfilled goal positions."""
+        cols = self._cols
+        cells = self._rows * cols
+        index_bits = cells.bit_length()
+        player_position = divmod(state & ((1 << index_bits) - 1), cols)
+        state >>= index_bits
+        entity_map = state & ((1 << cells) - 1)
+        state >>= cells
+        goal_map = state & ((1 << cells) - 1)
+        codes = state >> cells
+        entities: dict[Position, int] = dict()
+        slot = 0
+        for index in range(cells):
+            if entity_map >> index & 1:
+                entities[divmod(index, cols)] = codes >> (4 * slot) & 0xF
+                slot += 1
+        goals = [divmod(index, cols) for index in range(cells) if goal_map >> index & 1]
+        return player_position, entities, goals
+    
+    
+# Body shared by the four direction-specialized move methods. Only four
+# directions exist, so the delta constants are inlined as literals and each
+# specialization runs straight-line code with no per-call delta lookup (and
+# lets the compiler constant-fold the zero-delta arithmetic).
+_MOVE_TEMPLATE = '''
+def _move_method(self) -> bool:
+    # hoist hot attributes into locals; this runs once per turn
+    grid = self._grid
+    entity_grid = self._entity_grid
+    entities = self._entities
+    cols = self._stride
+    x1, y1 = self._player_position
+    # the jitted core does all the geometric checks; we just apply side effects
+    outcome = _attempt_move_core(
+        grid, entity_grid, x1, y1, {DX}, {DY}, self._player_strength
+    )
+    if outcome == MOVE_BLOCKED:
+        return False
+    x2, y2 = x1 + {DX}, y1 + {DY}
+    key2 = x2 * cols + y2
+    dirty = self._dirty
+    if outcome == MOVE_PUSH_CRATE:
+        # move the crate to new position (x3, y3)
+        x3, y3 = x2 + {DX}, y2 + {DY}
+        entities[x3 * cols + y3] = entities.pop(key2)
+        entity_grid[x3, y3] = entity_grid[x2, y2]
+        entity_grid[x2, y2] = 0
+        dirty.add((x3, y3))
+    elif outcome == MOVE_FILL_GOAL:
+        # remove the crate and set the goal to be filled
+        x3, y3 = x2 + {DX}, y2 + {DY}
+        entities.pop(key2)
+        entity_grid[x2, y2] = 0
+        grid[x3, y3] = FILLED_GOAL_CODE
+        self._unfilled_goal_count -= 1
+        dirty.add((x3, y3))
+    elif outcome == MOVE_PICKUP:
+        entity = entities.pop(key2)
+        entity_grid[x2, y2] = 0
+        effect = entity.effect()
+        self._player_strength += effect.get('strength', 0)
+        self._player_moves += effect.get('moves', 0)
+    # move player to the new position and update moves
+    dirty.add((x1, y1))
+    dirty.add((x2, y2))
+    self._player_position = (x2, y2)
+    self._player_moves -= 1
+    return True
+'''
+
+
+def _specialize_move_methods() -> dict[str, Callable]:
+    """Compiles one move method per direction from _MOVE_TEMPLATE, with the direction's deltas baked in."""
+    dispatch = dict()
+    for direction, (dx, dy) in DIRECTION_DELTAS.items():
+        namespace = dict()
+        exec(_MOVE_TEMPLATE.format(DX=dx, DY=dy), globals(), namespace)
+        dispatch[direction] = namespace['_move_method']
+    return dispatch
+
+
+SokobanModel._DISPATCH = _specialize_move_methods()
+
+
+class StepResult(NamedTuple):
+    """The outcome of advancing the game by one action: whether the move was applied, and whether the game is now
+    won or lost. Winning on the final move counts as a win, not a loss."""
+    moved: bool
+    won: bool
+    lost: bool
+
+
 class Sokoban(object):
     """The Sokoban class represents the controller class in the MVC structure. It is responsible for instantiating the
     model class (that you just wrote) and the view class (which is provided in a2_support.py). The controller class
@@ -364,19 +688,43 @@ class Sokoban(object):
         self._view = SokobanView()
     
     def display(self) -> None:
-        """This method should call the display_game and display_stats methods on the instance of the SokobanView
+        """This method should call the display_diff and display_stats methods on the instance of the SokobanView
         class. The arguments given should be based on the state of the game as defined by the SokobanModel
-        instance."""
-        self._view.display_game(
-            maze=self._model.get_maze(),
-            entities=self._model.get_entities(),
-            player_position=self._model.get_player_position()
+        instance. Only the cells the model marked dirty are rebuilt; the first frame is rendered in full."""
+        model = self._model
+        self._view.display_diff(
+            maze=model.get_maze(),
+            entities=model.get_entities(),
+            player_position=model.get_player_position(),
+            dirty=model.get_dirty_positions()
         )
+        model.clear_dirty()
         self._view.display_stats(
-            moves_remaining=self._model.get_player_moves_remaining(),
-            strength=self._model.get_player_strength()
+            moves_remaining=model.get_player_moves_remaining(),
+            strength=model.get_player_strength()
         )
         
+    def step(self, action: str) -> StepResult:
+        """Advances the game by a single action with no rendering or input handling.
+
+        Solvers and automated benchmarks should call this (or run_actions) directly in their inner loop, so each
+        move costs only the model update and not a full redraw of the maze."""
+        model = self._model
+        moved = model.attempt_move(action)
+        won = model.has_won()
+        lost = moved and not won and model.get_player_moves_remaining() == 0
+        return StepResult(moved, won, lost)
+
+    def run_actions(self, actions: Iterable[str]) -> StepResult:
+        """Feeds a batch of actions through step without displaying anything, stopping early once the game is won
+        or lost. Returns the result of the last step taken."""
+        result = StepResult(False, self._model.has_won(), False)
+        for action in actions:
+            result = self.step(action)
+            if result.won or result.lost:
+                break
+        return result
+
     def play_game(self) -> None:
         """"""
         while not self._model.has_won():
@@ -384,11 +732,11 @@ class Sokoban(object):
             command = input("Enter move: ")
             if command.lower() == 'q':
                 return
-            is_moved = self._model.attempt_move(command)
-            if not is_moved:
+            moved, won, lost = self.step(command)
+            if not moved:
                 print("Invalid move\n")
                 continue
-            if self._model.get_player_moves_remaining() == 0:
+            if lost:
                 print("You lost!")
                 return
         print("You won!")
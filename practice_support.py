@@ -8,6 +8,12 @@ FLOOR = ' '
 GOAL = 'G'
 FILLED_GOAL = 'X'
 
+# Integer tile codes used for the uint8 grid representation
+FLOOR_CODE = 0
+WALL_CODE = 1
+GOAL_CODE = 2
+FILLED_GOAL_CODE = 3
+
 # Entity constants
 CRATE = 'C'
 PLAYER = 'P'
@@ -15,6 +21,14 @@ STRENGTH_POTION = 'S'
 MOVE_POTION = 'M'
 FANCY_POTION = 'F'
 
+# Integer entity codes used for the uint8 entity grid. 0 means no entity,
+# 1-10 are crates keyed by their strength plus one (so a strength-0 crate is
+# still distinguishable from an empty cell), and the remaining codes are potions.
+CRATE_CODE_MAX = 10
+STRENGTH_POTION_CODE = 11
+MOVE_POTION_CODE = 12
+FANCY_POTION_CODE = 13
+
 # Movement constants
 UP = 'w'
 DOWN = 's'
@@ -51,6 +65,10 @@ def read_file(maze_file: str) -> tuple[list[list[str]], list[int, int]]:
 
 class SokobanView:
     """ A simple text-based view for Fancy Sokoban. """
+    def __init__(self) -> None:
+        # the characters of the last rendered frame, one list per maze row
+        self._lines = None
+
     def display_game(
         self,
         maze: Grid,
@@ -58,19 +76,51 @@ class SokobanView:
         player_position: Position
     ) -> None:
         """ Display the current state of the game.
-        
+
         Parameters:
             maze: The current maze.
             entities: A dictionary mapping positions to entities
             player_position: The current position of the player.
         """
-        for i, row in enumerate(maze):
-            for j, tile in enumerate(row):
-                if (i, j) == player_position:
-                    print(PLAYER, end='')
-                else:
-                    print(entities.get((i, j), tile), end='')
-            print()
+        self._lines = [
+            [
+                PLAYER if (i, j) == player_position
+                else str(entities.get((i, j), tile))
+                for j, tile in enumerate(row)
+            ]
+            for i, row in enumerate(maze)
+        ]
+        self._print_frame()
+
+    def display_diff(
+        self,
+        maze: Grid,
+        entities: Entities,
+        player_position: Position,
+        dirty: set[Position]
+    ) -> None:
+        """ Display the current state of the game, rebuilding only the given
+        dirty cells of the previously rendered frame. Falls back to a full
+        display_game when no frame has been rendered yet.
+
+        Parameters:
+            maze: The current maze.
+            entities: A dictionary mapping positions to entities
+            player_position: The current position of the player.
+            dirty: The positions whose contents changed since the last frame.
+        """
+        if self._lines is None:
+            self.display_game(maze, entities, player_position)
+            return
+        for i, j in dirty:
+            if (i, j) == player_position:
+                self._lines[i][j] = PLAYER
+            else:
+                self._lines[i][j] = str(entities.get((i, j), maze[i][j]))
+        self._print_frame()
+
+    def _print_frame(self) -> None:
+        print('\n'.join(''.join(line) for line in self._lines))
         print()
 
     def display_stats(self, moves_remaining: int, strength: int) -> None: